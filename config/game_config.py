@@ -10,16 +10,21 @@ class GameConfig:
         grid_size: Size of the grid (width and height)
         alive_char: Character to display for alive cells
         dead_char: Character to display for dead cells
-        delay: Delay between generations in seconds
+        delay: Delay between rendered frames in seconds
         initial_density: Initial probability of cells being alive (0.0-1.0)
-        clear_command: OS command to clear the screen
+        clear_sequence: Terminal escape sequence that clears the screen
+        render_every: Number of generations to advance per rendered frame
+        boundary: Edge handling: 'fill' treats cells beyond the edges as
+            dead, 'wrap' joins opposite edges into a torus
     """
     grid_size: int = 30
     alive_char: str = '█'
     dead_char: str = ' '
     delay: float = 0.15
     initial_density: float = 0.3
-    clear_command: str = 'clear'
+    clear_sequence: str = '\x1b[H\x1b[2J'
+    render_every: int = 1
+    boundary: str = 'fill'
     
     def __post_init__(self):
         """Validate configuration values."""
@@ -29,3 +34,7 @@ class GameConfig:
             raise ValueError(f"Grid size must be positive, got {self.grid_size}")
         if self.delay < 0:
             raise ValueError(f"Delay must be non-negative, got {self.delay}")
+        if self.render_every < 1:
+            raise ValueError(f"Render interval must be positive, got {self.render_every}")
+        if self.boundary not in ('fill', 'wrap'):
+            raise ValueError(f"Boundary must be 'fill' or 'wrap', got {self.boundary!r}")
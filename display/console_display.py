@@ -1,8 +1,8 @@
 """Console display for Game of Life."""
-import os
+import sys
+from typing import List
 from domain.grid import Grid
 from domain.generation import Generation
-from domain.position import Position
 from config.game_config import GameConfig
 
 
@@ -16,51 +16,56 @@ class ConsoleDisplay:
     def __init__(self, config: GameConfig):
         """Initialize the console display.
         
+        Borders and the cell-state-to-characters table depend only on
+        the configuration, so they are built once here.
+        
         Args:
             config: Game configuration
         """
         self.config = config
+        width = config.grid_size * 2
+        self._top_border = "╔" + "═" * width + "╗"
+        self._middle_border = "╠" + "═" * width + "╣"
+        self._bottom_border = "╚" + "═" * width + "╝"
+        self._cell_chars = {0: config.dead_char * 2, 1: config.alive_char * 2}
     
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system(self.config.clear_command)
+        sys.stdout.write(self.config.clear_sequence)
+        sys.stdout.flush()
     
     def render(self, grid: Grid, generation: Generation) -> None:
         """Render the complete game state to console.
         
+        The screen clear and the whole frame are built as one string
+        and written at once, so the terminal redraws in a single update.
+        
         Args:
             grid: The game grid to display
             generation: Current generation number
         """
-        self.clear_screen()
-        self._render_header(generation)
-        self._render_grid(grid)
-        self._render_footer()
+        lines = (self._header_lines(generation)
+                 + self._grid_lines(grid)
+                 + self._footer_lines())
+        sys.stdout.write(self.config.clear_sequence + "\n".join(lines) + "\n")
+        sys.stdout.flush()
     
-    def _render_header(self, generation: Generation) -> None:
-        """Render the header with game title and generation."""
-        width = self.config.grid_size * 2
-        print("╔" + "═" * width + "╗")
-        print(f"║  Conway's Game of Life - Generation {generation:>8}  ║")
-        print("╠" + "═" * width + "╣")
+    def _header_lines(self, generation: Generation) -> List[str]:
+        """Return the header with game title and generation."""
+        return [
+            self._top_border,
+            f"║  Conway's Game of Life - Generation {generation:>8}  ║",
+            self._middle_border,
+        ]
     
-    def _render_grid(self, grid: Grid) -> None:
-        """Render the grid cells."""
-        grid_size = grid.size()
-        for row in range(grid_size.height):
-            print("║", end="")
-            for col in range(grid_size.width):
-                position = Position(row, col)
-                cell = grid.get_cell(position)
-                char = self.config.alive_char if cell.is_alive() else self.config.dead_char
-                print(char * 2, end="")
-            print("║")
+    def _grid_lines(self, grid: Grid) -> List[str]:
+        """Return the grid cells, one line per row."""
+        return ["║" + row.decode('latin-1').translate(self._cell_chars) + "║"
+                for row in grid.rows()]
     
-    def _render_footer(self) -> None:
-        """Render the footer with instructions."""
-        width = self.config.grid_size * 2
-        print("╚" + "═" * width + "╝")
-        print("\nPress Ctrl+C to stop")
+    def _footer_lines(self) -> List[str]:
+        """Return the footer with instructions."""
+        return [self._bottom_border, "", "Press Ctrl+C to stop"]
     
     def show_exit_message(self, generation: Generation) -> None:
         """Show graceful exit message.
@@ -0,0 +1,106 @@
+"""Bit-packed neighbor counting for Game of Life grids.
+
+A bitboard packs a row-major grid into one integer, bit
+row * width + col per cell, so every shift and bitwise operation
+works on all cells at once.
+"""
+from functools import lru_cache
+from typing import Tuple
+
+# Byte translation tables between cell states (0/1) and binary digits
+_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack(cells: bytes) -> int:
+    """Pack row-major cell states (one byte, 0 or 1, per cell) into bits."""
+    return int(cells.translate(_TO_DIGITS)[::-1], 2)
+
+
+def unpack(bits: int, length: int) -> bytes:
+    """Unpack bits produced by pack into length cell states."""
+    digits = format(bits, f'0{length}b')[::-1]
+    return digits.encode('ascii').translate(_FROM_DIGITS)
+
+
+def count_neighbors(alive: int, width: int, height: int,
+                    wrap: bool = False) -> Tuple[int, int, int]:
+    """Count living neighbors of every cell of a bitboard.
+    
+    Each row's horizontal sums are computed once, as bit-sliced
+    (ones, twos) planes, then shifted up and down to serve the rows
+    above and below, so the eight neighbor planes are never built.
+    Counts of four or more are merged into one plane, as no rule
+    needs to tell them apart.
+    
+    Args:
+        alive: Bitboard of living cells
+        width: Grid width (number of columns)
+        height: Grid height (number of rows)
+        wrap: Whether edges wrap around to the opposite side (a torus)
+            instead of bordering on dead cells
+        
+    Returns:
+        Bit-sliced counts (ones, twos, four_or_more): bit i of ones and
+        twos is the matching binary digit of the count for cell i, and
+        bit i of four_or_more is set when that count is at least 4
+    """
+    everything, not_first_column, not_last_column = _trimmed_edge_masks(width, height)
+    west = (alive << 1) & not_first_column
+    east = (alive >> 1) & not_last_column
+    if wrap:
+        west |= (alive >> (width - 1)) & (everything ^ not_first_column)
+        east |= (alive << (width - 1)) & (everything ^ not_last_column)
+    trio_ones, trio_twos = _full_adder(west, alive, east)
+    pair_ones, pair_twos = west ^ east, west & east
+    if wrap:
+        ones, carry = _full_adder(pair_ones, *_wrapped_rows(trio_ones, width, height))
+        partial_twos, fours_a = _full_adder(pair_twos,
+                                            *_wrapped_rows(trio_twos, width, height))
+    else:
+        ones, carry = _full_adder((trio_ones << width) & everything, pair_ones,
+                                  trio_ones >> width)
+        partial_twos, fours_a = _full_adder((trio_twos << width) & everything, pair_twos,
+                                            trio_twos >> width)
+    twos, fours_b = partial_twos ^ carry, partial_twos & carry
+    return ones, twos, fours_a | fours_b
+
+
+def _trimmed_edge_masks(width: int, height: int) -> Tuple[int, int, int]:
+    """Return the edge masks of _edge_masks for exactly height rows.
+    
+    Masks are cached for heights rounded up to a power of two and cut
+    down here, so stepping bands of every height keeps only a handful
+    of cached masks per width instead of one set per band height.
+    """
+    cached_height = 1 << (height - 1).bit_length()
+    masks = _edge_masks(width, cached_height)
+    if cached_height == height:
+        return masks
+    everything = (1 << width * height) - 1
+    return everything, masks[1] & everything, masks[2] & everything
+
+
+@lru_cache(maxsize=None)
+def _edge_masks(width: int, height: int) -> Tuple[int, int, int]:
+    """Return (all cells, all but first column, all but last column)."""
+    everything = (1 << width * height) - 1
+    first_column = int(('0' * (width - 1) + '1') * height, 2)
+    last_column = first_column << (width - 1)
+    return everything, everything ^ first_column, everything ^ last_column
+
+
+def _wrapped_rows(plane: int, width: int, height: int) -> Tuple[int, int]:
+    """Return plane moved one row down and one row up, wrapping around."""
+    everything = (1 << width * height) - 1
+    last_row_offset = width * (height - 1)
+    down = ((plane << width) & everything) | (plane >> last_row_offset)
+    up = (plane >> width) | ((plane & ((1 << width) - 1)) << last_row_offset)
+    return down, up
+
+
+def _full_adder(a: int, b: int, c: int) -> Tuple[int, int]:
+    """Add three bit planes, returning the (sum, carry) planes."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
@@ -1,25 +1,32 @@
 """Cell domain object for Game of Life."""
 from dataclasses import dataclass
+from typing import ClassVar
 
 
 @dataclass(frozen=True)
 class Cell:
     """Represents a single cell in the Game of Life.
     
+    Cells are immutable, so only two instances are ever needed: the
+    factories return shared alive and dead cells instead of new objects.
+    
     Attributes:
         alive: Whether the cell is alive or dead
     """
     alive: bool
     
+    _ALIVE: ClassVar['Cell']
+    _DEAD: ClassVar['Cell']
+    
     @classmethod
     def alive_cell(cls) -> 'Cell':
-        """Create an alive cell."""
-        return cls(alive=True)
+        """Return the shared alive cell."""
+        return cls._ALIVE
     
     @classmethod
     def dead_cell(cls) -> 'Cell':
-        """Create a dead cell."""
-        return cls(alive=False)
+        """Return the shared dead cell."""
+        return cls._DEAD
     
     def is_alive(self) -> bool:
         """Check if the cell is alive."""
@@ -28,3 +35,7 @@ class Cell:
     def is_dead(self) -> bool:
         """Check if the cell is dead."""
         return not self.alive
+
+
+Cell._ALIVE = Cell(alive=True)
+Cell._DEAD = Cell(alive=False)
@@ -1,31 +1,95 @@
 """Grid first-class collection for Game of Life."""
-from typing import Dict, Set
+import random
+from itertools import compress
+from typing import FrozenSet, Iterable, List, Optional, TYPE_CHECKING
+from domain import bitboard
 from domain.cell import Cell
-from domain.position import Position
+from domain.position import Position, NEIGHBOR_OFFSETS
 from domain.grid_size import GridSize
 
+if TYPE_CHECKING:
+    from rules.game_rules import GameRules
+
+# Shared cells indexed by their stored state (0 or 1)
+_CELLS_BY_STATE = (Cell.dead_cell(), Cell.alive_cell())
+
 
 class Grid:
     """First-class collection representing the game grid.
     
     Encapsulates the 2D grid of cells and provides operations
-    for querying and manipulating cell states.
+    for querying and manipulating cell states. Cells are stored
+    row-major in a flat bytearray, one byte (0 or 1) per cell.
+    
+    Stepping works on a bitboard of the same cells instead. Each
+    grid keeps its bitboard between generations and only unpacks
+    it into bytes once a cell is read or written, so consecutive
+    steps never convert between the two.
     """
     
     def __init__(self, size: GridSize):
-        """Initialize grid with given size.
+        """Initialize grid with given size, all cells dead.
         
         Args:
             size: Dimensions of the grid
         """
         self._size = size
-        self._cells: Dict[Position, Cell] = {}
-        self._initialize_empty()
+        self._cells = bytearray(size.width * size.height)
+        self._bits: Optional[int] = 0
+        self._cells_stale = False
+        self._living_cells: Optional[FrozenSet[Position]] = None
+    
+    @classmethod
+    def randomly_populated(cls, size: GridSize, density: float,
+                           rng: Optional[random.Random] = None) -> 'Grid':
+        """Create a grid where each cell is alive with the given probability.
+        
+        Args:
+            size: Dimensions of the grid
+            density: Probability that a cell is alive (0.0 to 1.0)
+            rng: Random number generator to draw from (defaults to the
+                random module's shared generator)
+        """
+        grid = cls(size)
+        grid.fill_randomly(density, rng)
+        return grid
     
-    def _initialize_empty(self) -> None:
-        """Initialize all cells as dead."""
-        for position in self._size.all_positions():
-            self._cells[position] = Cell.dead_cell()
+    def fill_randomly(self, density: float, rng: Optional[random.Random] = None) -> None:
+        """Overwrite every cell, alive with the given probability.
+        
+        One random byte is drawn per cell and mapped to a state through
+        a threshold table. Bytes that land exactly on the threshold
+        bucket are resolved with one more random draw each, so every
+        density gets the right expected count, not just multiples of
+        1/256. Densities 0 and 1 draw no random numbers at all.
+        
+        Args:
+            density: Probability that a cell is alive (0.0 to 1.0)
+            rng: Random number generator to draw from (defaults to the
+                random module's shared generator)
+        """
+        if density <= 0:
+            self._cells[:] = bytes(len(self._cells))
+        elif density >= 1:
+            self._cells[:] = b'\x01' * len(self._cells)
+        else:
+            source = rng or random
+            scaled = density * 256
+            whole = int(scaled)
+            # Bytes below whole are alive; byte whole is marked 2 and resolved below
+            states = b'\x01' * whole + b'\x02' + bytes(255 - whole)
+            self._cells[:] = source.randbytes(len(self._cells)).translate(states)
+            fraction = scaled - whole
+            index = self._cells.find(2)
+            while index >= 0:
+                self._cells[index] = source.random() < fraction
+                index = self._cells.find(2, index + 1)
+        self._cells_stale = False
+        self._cells_changed()
+    
+    def _index(self, position: Position) -> int:
+        """Return the flat storage index of a position."""
+        return position.row * self._size.width + position.col
     
     def set_cell(self, position: Position, cell: Cell) -> None:
         """Set the state of a cell at position.
@@ -39,7 +103,9 @@ class Grid:
         """
         if not self._size.contains(position):
             raise ValueError(f"Position {position} out of bounds")
-        self._cells[position] = cell
+        self._unpack_pending()
+        self._cells[self._index(position)] = cell.is_alive()
+        self._cells_changed()
     
     def get_cell(self, position: Position) -> Cell:
         """Get the cell at position.
@@ -52,29 +118,188 @@ class Grid:
         """
         if not self._size.contains(position):
             return Cell.dead_cell()
-        return self._cells.get(position, Cell.dead_cell())
+        self._unpack_pending()
+        return _CELLS_BY_STATE[self._cells[self._index(position)]]
     
-    def count_living_neighbors(self, position: Position) -> int:
+    def count_living_neighbors(self, position: Position, wrap: bool = False) -> int:
         """Count living neighbors for a position.
         
+        Sums the in-bounds part of the 3x3 block around the position
+        straight from storage, minus the cell itself.
+        
         Args:
             position: Position to count neighbors for
+            wrap: Whether edges wrap around to the opposite side
             
         Returns:
             Number of living neighbors (0-8)
         """
-        return sum(1 for neighbor in position.neighbors()
-                   if self._size.contains(neighbor)
-                   and self.get_cell(neighbor).is_alive())
+        self._unpack_pending()
+        width = self._size.width
+        if wrap:
+            height, row, col = self._size.height, position.row, position.col
+            return sum(self._cells[(row + dr) % height * width + (col + dc) % width]
+                       for dr, dc in NEIGHBOR_OFFSETS)
+        first_col, end_col = max(position.col - 1, 0), min(position.col + 2, width)
+        if first_col >= end_col:
+            return 0
+        first_row = max(position.row - 1, 0)
+        end_row = min(position.row + 2, self._size.height)
+        block = sum(sum(self._cells[row * width + first_col:row * width + end_col])
+                    for row in range(first_row, end_row))
+        return block - self.get_cell(position).is_alive()
+    
+    def next_generation(self, rules: 'GameRules', into: Optional['Grid'] = None,
+                        wrap: bool = False) -> 'Grid':
+        """Calculate the next generation of the whole grid at once.
+        
+        Cells are packed one bit each into a single integer, so every
+        shift and bitwise operation below updates all cells together.
+        The result stays packed in the returned grid until its cells
+        are accessed, which also makes it safe to pass this grid as
+        into and step in place.
+        
+        Args:
+            rules: Rules deciding each cell's next state
+            into: Grid to overwrite with the result instead of
+                allocating a new one (may be this grid)
+            wrap: Whether edges wrap around to the opposite side (a
+                torus) instead of bordering on dead cells
+                
+        Returns:
+            Grid holding the next generation (into, if given)
+            
+        Raises:
+            ValueError: If into has a different size
+        """
+        if into is None:
+            into = Grid(self._size)
+        elif into.size() != self._size:
+            raise ValueError(f"Cannot write a {self._size} grid into a {into.size()} grid")
+        into._bits = self._next_bits(rules, wrap)
+        into._cells_stale = True
+        into._living_cells = None
+        return into
+    
+    def _next_bits(self, rules: 'GameRules', wrap: bool) -> int:
+        """Return the bitboard of the next generation.
+        
+        Without wrapping, only the band of rows around living cells is
+        stepped: cells further away have no living neighbors and stay
+        dead.
+        """
+        alive = self._alive_bits()
+        if not alive:
+            return 0
+        width = self._size.width
+        if wrap:
+            counts = bitboard.count_neighbors(alive, width, self._size.height, wrap=True)
+            return rules.calculate_next_bits(alive, counts)
+        first_row = max(((alive & -alive).bit_length() - 1) // width - 1, 0)
+        end_row = min((alive.bit_length() - 1) // width + 2, self._size.height)
+        offset = first_row * width
+        band = alive >> offset
+        counts = bitboard.count_neighbors(band, width, end_row - first_row)
+        return rules.calculate_next_bits(band, counts) << offset
+    
+    def _alive_bits(self) -> int:
+        """Return the bitboard of living cells, packing storage if needed."""
+        if self._bits is None:
+            self._bits = bitboard.pack(self._cells)
+        return self._bits
+    
+    def _unpack_pending(self) -> None:
+        """Bring byte storage up to date with a pending bitboard."""
+        if self._cells_stale:
+            self._cells[:] = bitboard.unpack(self._bits, len(self._cells))
+            self._cells_stale = False
+    
+    def _cells_changed(self) -> None:
+        """Drop everything derived from byte storage after writing to it."""
+        self._bits = None
+        self._living_cells = None
+    
+    def row(self, index: int) -> bytes:
+        """Return the cell states of one row, one byte (0 or 1) per cell.
+        
+        Args:
+            index: Row index (0-based)
+            
+        Returns:
+            Row states, or all dead cells if the row is out of bounds
+        """
+        width = self._size.width
+        if not 0 <= index < self._size.height:
+            return bytes(width)
+        self._unpack_pending()
+        return bytes(self._cells[index * width:(index + 1) * width])
     
-    def living_cells(self) -> Set[Position]:
+    def set_row(self, index: int, states: Iterable[bool]) -> None:
+        """Overwrite the states of one row.
+        
+        Args:
+            index: Row index (0-based)
+            states: One truthy (alive) or falsy (dead) value per column
+            
+        Raises:
+            ValueError: If the row is out of bounds or states has the wrong length
+        """
+        width = self._size.width
+        if not 0 <= index < self._size.height:
+            raise ValueError(f"Row {index} out of bounds")
+        row = bytes(map(bool, states))
+        if len(row) != width:
+            raise ValueError(f"Expected {width} cell states, got {len(row)}")
+        self._unpack_pending()
+        self._cells[index * width:(index + 1) * width] = row
+        self._cells_changed()
+    
+    def rows(self) -> List[bytes]:
+        """Return the cell states of each row, one byte (0 or 1) per cell.
+        
+        Returns:
+            List of rows from top to bottom
+        """
+        self._unpack_pending()
+        cells, width = bytes(self._cells), self._size.width
+        return [cells[i * width:(i + 1) * width] for i in range(self._size.height)]
+    
+    def alive_count(self) -> int:
+        """Return the number of living cells.
+        
+        Returns:
+            Count of alive cells, taken as a popcount of the bitboard
+        """
+        return self._alive_bits().bit_count()
+    
+    def snapshot(self) -> int:
+        """Return an immutable snapshot of every cell state.
+        
+        The snapshot is the grid's bitboard, so it is free to take
+        right after a step. Snapshots of grids of the same size are
+        equal exactly when all their cells match.
+        
+        Returns:
+            Bit-packed cell states, bit row * width + col per cell
+        """
+        return self._alive_bits()
+    
+    def living_cells(self) -> FrozenSet[Position]:
         """Return all positions with living cells.
         
+        The set is built on first use and cached until the grid is
+        next modified, so repeated queries of one generation are free.
+        
         Returns:
             Set of positions containing alive cells
         """
-        return {pos for pos, cell in self._cells.items()
-                if cell.is_alive()}
+        if self._living_cells is None:
+            self._unpack_pending()
+            width = self._size.width
+            indices = compress(range(len(self._cells)), self._cells)
+            self._living_cells = frozenset(Position(*divmod(index, width))
+                                           for index in indices)
+        return self._living_cells
     
     def size(self) -> GridSize:
         """Return the grid size.
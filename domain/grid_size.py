@@ -1,6 +1,7 @@
 """GridSize domain object for Game of Life."""
 from dataclasses import dataclass
-from typing import List, TYPE_CHECKING
+from functools import cached_property
+from typing import Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from domain.position import Position
@@ -29,13 +30,21 @@ class GridSize:
         return (0 <= position.row < self.height and
                 0 <= position.col < self.width)
     
-    def all_positions(self) -> List['Position']:
+    def all_positions(self) -> Tuple['Position', ...]:
         """Return all positions in the grid.
         
+        The size is immutable, so the positions are built once and the
+        same tuple is returned on every call.
+        
         Returns:
-            List of all valid positions in row-major order
+            Tuple of all valid positions in row-major order
         """
+        return self._all_positions
+    
+    @cached_property
+    def _all_positions(self) -> Tuple['Position', ...]:
+        """Build all positions in row-major order (cached per instance)."""
         from domain.position import Position
-        return [Position(row, col)
-                for row in range(self.height)
-                for col in range(self.width)]
+        return tuple(Position(row, col)
+                     for row in range(self.height)
+                     for col in range(self.width))
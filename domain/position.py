@@ -2,6 +2,12 @@
 from dataclasses import dataclass
 from typing import List
 
+# (row, col) offsets of the 8 surrounding positions
+NEIGHBOR_OFFSETS = tuple((dr, dc)
+                          for dr in (-1, 0, 1)
+                          for dc in (-1, 0, 1)
+                          if (dr, dc) != (0, 0))
+
 
 @dataclass(frozen=True)
 class Position:
@@ -20,12 +26,8 @@ class Position:
         Returns positions in all 8 directions (including diagonals).
         Does not check if neighbors are within grid bounds.
         """
-        return [
-            Position(self.row + dr, self.col + dc)
-            for dr in [-1, 0, 1]
-            for dc in [-1, 0, 1]
-            if not (dr == 0 and dc == 0)
-        ]
+        row, col = self.row, self.col
+        return [Position(row + dr, col + dc) for dr, dc in NEIGHBOR_OFFSETS]
     
     def __str__(self) -> str:
         """String representation of position."""
@@ -2,8 +2,6 @@
 import time
 from domain.grid import Grid
 from domain.generation import Generation
-from domain.position import Position
-from domain.cell import Cell
 from rules.game_rules import GameRules
 from display.console_display import ConsoleDisplay
 from config.game_config import GameConfig
@@ -22,6 +20,9 @@ class GameEngine:
     def __init__(self, grid: Grid, config: GameConfig):
         """Initialize the game engine.
         
+        The engine owns the grid from here on: each step overwrites it
+        with the next generation instead of allocating a new grid.
+        
         Args:
             grid: Initial game grid
             config: Game configuration
@@ -38,12 +39,32 @@ class GameEngine:
         self.generation = self.generation.next()
     
     def run(self) -> None:
-        """Run the game loop until interrupted by the user."""
+        """Run the game loop until interrupted by the user.
+        
+        Frames are paced against a monotonic deadline, so time spent
+        stepping and rendering counts towards the delay instead of
+        adding to it. When a frame finishes past its deadline, the next
+        render is skipped (but never two in a row) so the simulation
+        can catch up. After falling more than a whole frame behind, as
+        after a stall, the schedule restarts from now instead.
+        """
         try:
+            deadline = time.monotonic()
+            render = True
             while True:
-                self.display.render(self.grid, self.generation)
-                time.sleep(self.config.delay)
-                self.step()
+                if render:
+                    self.display.render(self.grid, self.generation)
+                for _ in range(self.config.render_every):
+                    self.step()
+                deadline += self.config.delay
+                lag = time.monotonic() - deadline
+                if lag > self.config.delay:
+                    deadline = time.monotonic()
+                    render = True
+                    continue
+                if lag < 0:
+                    time.sleep(-lag)
+                render = not render or lag <= 0 or self.config.delay == 0
         except KeyboardInterrupt:
             self.display.show_exit_message(self.generation)
     
@@ -51,17 +72,7 @@ class GameEngine:
         """Calculate the next generation based on current state.
         
         Returns:
-            New grid representing the next generation
+            The current grid, overwritten with the next generation
         """
-        grid_size = self.grid.size()
-        new_grid = Grid(grid_size)
-        
-        for position in grid_size.all_positions():
-            current_cell = self.grid.get_cell(position)
-            neighbor_count = self.grid.count_living_neighbors(position)
-            next_cell = self.rules.calculate_next_state(current_cell, neighbor_count)
-            
-            if next_cell.is_alive():
-                new_grid.set_cell(position, next_cell)
-        
-        return new_grid
+        wrap = self.config.boundary == 'wrap'
+        return self.grid.next_generation(self.rules, into=self.grid, wrap=wrap)
@@ -8,9 +8,10 @@ interrupted by the user (Ctrl+C).
 """
 
 import os
-import time
 import random
-from typing import List
+import time
+from dataclasses import replace
+from typing import List, Optional
 
 from config.game_config import GameConfig
 from domain.grid import Grid
@@ -42,24 +43,32 @@ class GridAccessor:
             yield RowAccessor(self._game, row)
     
     def __eq__(self, other) -> bool:
-        """Support comparison for tests."""
+        """Support comparison for tests.
+        
+        Grids are compared by snapshot, and nested lists of bools row by
+        row as bytes, so no list of bools is built for either.
+        """
         if isinstance(other, GridAccessor):
-            return self._to_list() == other._to_list()
+            grid, other_grid = self._game._grid, other._game._grid
+            return grid.size() == other_grid.size() and grid.snapshot() == other_grid.snapshot()
         elif isinstance(other, list):
-            return self._to_list() == other
+            return self._equals_rows(other)
         return False
     
+    def _equals_rows(self, other: list) -> bool:
+        """Compare with a 2D list, falling back to lists for non-0/1 values."""
+        rows = self._game._grid.rows()
+        if len(other) != len(rows):
+            return False
+        try:
+            return all(isinstance(expected, list) and bytes(expected) == row
+                       for expected, row in zip(other, rows))
+        except (TypeError, ValueError):
+            return self._to_list() == other
+    
     def _to_list(self) -> List[List[bool]]:
         """Convert to 2D boolean list."""
-        result = []
-        for row in range(self._game.config.grid_size):
-            row_list = []
-            for col in range(self._game.config.grid_size):
-                position = Position(row, col)
-                cell = self._game._grid.get_cell(position)
-                row_list.append(cell.is_alive())
-            result.append(row_list)
-        return result
+        return [list(map(bool, row)) for row in self._game._grid.rows()]
 
 
 class RowAccessor:
@@ -73,13 +82,7 @@ class RowAccessor:
         """Get cell value or slice of cells."""
         if isinstance(col, slice):
             # Handle row[:] or row[start:end] syntax
-            result = []
-            start, stop, step = col.indices(self._game.config.grid_size)
-            for c in range(start, stop, step or 1):
-                position = Position(self._row, c)
-                cell = self._game._grid.get_cell(position)
-                result.append(cell.is_alive())
-            return result
+            return list(map(bool, self._game._grid.row(self._row)[col]))
         else:
             position = Position(self._row, col)
             cell = self._game._grid.get_cell(position)
@@ -96,8 +99,7 @@ class RowAccessor:
     
     def __iter__(self):
         """Iterate over cells in this row."""
-        for col in range(self._game.config.grid_size):
-            yield self[col]
+        return iter(self[:])
 
 
 class GameOfLife:
@@ -115,13 +117,19 @@ class GameOfLife:
     DEAD_CHAR = ' '
     DELAY = 0.15
     
-    def __init__(self, random_density: float = 0.3, config: GameConfig = None):
+    def __init__(self, random_density: float = 0.3, config: GameConfig = None,
+                 seed: Optional[int] = None):
         """
         Initialize the Game of Life.
         
+        Each game draws from its own random number generator, so games
+        never disturb each other's random sequences.
+        
         Args:
             random_density: Probability that a cell will be alive initially (0.0 to 1.0)
             config: Optional GameConfig instance (uses defaults if not provided)
+            seed: Seed for the game's random number generator (drawn once
+                from the random module if not provided)
         """
         self.config = config or GameConfig(
             grid_size=self.GRID_SIZE,
@@ -131,13 +139,30 @@ class GameOfLife:
             initial_density=random_density
         )
         self.random_density = random_density
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._rng = random.Random(seed)
         
         # Initialize domain objects
         grid_size = GridSize(self.config.grid_size, self.config.grid_size)
-        self._grid = Grid(grid_size)
+        self._grid = Grid.randomly_populated(grid_size, self.random_density, self._rng)
         self._generation = Generation(0)
+        self._rules = GameRules()
+    
+    def reset(self, random_density: float, seed: Optional[int] = None) -> None:
+        """
+        Restart the game from a new random pattern, reusing the grid.
         
-        self._initialize_grid()
+        Args:
+            random_density: Probability that a cell will be alive (0.0 to 1.0)
+            seed: Optional new seed for the game's random number generator
+        """
+        self.config = replace(self.config, initial_density=random_density)
+        self.random_density = random_density
+        if seed is not None:
+            self._rng.seed(seed)
+        self._grid.fill_randomly(random_density, self._rng)
+        self._generation = Generation(0)
     
     @property
     def grid(self) -> GridAccessor:
@@ -147,11 +172,35 @@ class GameOfLife:
     @grid.setter
     def grid(self, value: List[List[bool]]) -> None:
         """Backward compatibility: set grid from 2D boolean array."""
-        for row in range(self.config.grid_size):
-            for col in range(self.config.grid_size):
-                position = Position(row, col)
-                cell = Cell.alive_cell() if value[row][col] else Cell.dead_cell()
-                self._grid.set_cell(position, cell)
+        size = self.config.grid_size
+        for row in range(size):
+            self._grid.set_row(row, value[row][:size])
+    
+    @property
+    def alive_count(self) -> int:
+        """Number of living cells in the grid."""
+        return self._grid.alive_count()
+    
+    def snapshot(self) -> int:
+        """
+        Capture the current grid state for later comparison.
+        
+        Returns:
+            Opaque snapshot to pass to equals_snapshot
+        """
+        return self._grid.snapshot()
+    
+    def equals_snapshot(self, snapshot: int) -> bool:
+        """
+        Check whether the grid is in the state captured by snapshot().
+        
+        Args:
+            snapshot: Value returned by an earlier snapshot() call
+            
+        Returns:
+            True if every cell matches the snapshot
+        """
+        return self._grid.snapshot() == snapshot
     
     @property
     def generation(self) -> int:
@@ -163,13 +212,6 @@ class GameOfLife:
         """Backward compatibility: set generation from int."""
         self._generation = Generation(value)
     
-    def _initialize_grid(self) -> None:
-        """Initialize the grid with a random pattern."""
-        grid_size = self._grid.size()
-        for position in grid_size.all_positions():
-            if random.random() < self.random_density:
-                self._grid.set_cell(position, Cell.alive_cell())
-    
     def _count_neighbors(self, row: int, col: int) -> int:
         """
         Count the number of live neighbors for a given cell.
@@ -182,38 +224,8 @@ class GameOfLife:
             Number of live neighbors (0-8)
         """
         position = Position(row, col)
-        return self._grid.count_living_neighbors(position)
-    
-    def _calculate_next_generation(self) -> List[List[bool]]:
-        """
-        Calculate the next generation based on Conway's Game of Life rules.
-        
-        Now delegates to GameRules for rule logic.
-        
-        Returns:
-            New grid representing the next generation
-        """
-        grid_size = self._grid.size()
-        new_grid = Grid(grid_size)
-        rules = GameRules()
-        
-        for position in grid_size.all_positions():
-            current_cell = self._grid.get_cell(position)
-            neighbor_count = self._grid.count_living_neighbors(position)
-            next_cell = rules.calculate_next_state(current_cell, neighbor_count)
-            
-            if next_cell.is_alive():
-                new_grid.set_cell(position, next_cell)
-        
-        # Return as 2D boolean array for backward compatibility
-        result = []
-        for row in range(self.config.grid_size):
-            row_list = []
-            for col in range(self.config.grid_size):
-                pos = Position(row, col)
-                row_list.append(new_grid.get_cell(pos).is_alive())
-            result.append(row_list)
-        return result
+        wrap = self.config.boundary == 'wrap'
+        return self._grid.count_living_neighbors(position, wrap=wrap)
     
     def _clear_screen(self) -> None:
         """Clear the terminal screen (deprecated - use ConsoleDisplay)."""
@@ -226,8 +238,13 @@ class GameOfLife:
         display.render(self._grid, self._generation)
     
     def step(self) -> None:
-        """Advance the game by one generation."""
-        self.grid = self._calculate_next_generation()
+        """Advance the game by one generation.
+        
+        The whole grid is updated at once by Grid.next_generation;
+        _count_neighbors is not used on this path.
+        """
+        wrap = self.config.boundary == 'wrap'
+        self._grid.next_generation(self._rules, into=self._grid, wrap=wrap)
         self._generation = self._generation.next()
     
     def run(self) -> None:
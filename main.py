@@ -9,13 +9,10 @@ Clean architecture implementation using separated concerns:
 - Engine (GameEngine)
 """
 
-import random
 import time
 from config.game_config import GameConfig
 from domain.grid import Grid
 from domain.grid_size import GridSize
-from domain.position import Position
-from domain.cell import Cell
 from engine.game_engine import GameEngine
 
 
@@ -29,13 +26,7 @@ def create_random_grid(config: GameConfig) -> Grid:
         Grid with randomly populated cells
     """
     size = GridSize(config.grid_size, config.grid_size)
-    grid = Grid(size)
-    
-    for position in size.all_positions():
-        if random.random() < config.initial_density:
-            grid.set_cell(position, Cell.alive_cell())
-    
-    return grid
+    return Grid.randomly_populated(size, config.initial_density)
 
 
 def main():
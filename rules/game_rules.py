@@ -1,4 +1,5 @@
 """Conway's Game of Life rules implementation."""
+from typing import ClassVar, Tuple
 from domain.cell import Cell
 
 
@@ -10,8 +11,13 @@ class GameRules:
     2. Any live cell with two or three live neighbours lives on
     3. Any live cell with more than three live neighbours dies (over-population)
     4. Any dead cell with exactly three live neighbours becomes alive (reproduction)
+    
+    The rules only ever see 2 x 9 distinct inputs, so their outcomes are
+    precomputed into a table indexed by [cell is alive][living neighbors].
     """
     
+    _NEXT_STATES: ClassVar[Tuple[Tuple[Cell, ...], Tuple[Cell, ...]]]
+    
     @staticmethod
     def calculate_next_state(current_cell: Cell, living_neighbors: int) -> Cell:
         """Calculate the next state of a cell based on Conway's rules.
@@ -21,12 +27,29 @@ class GameRules:
             living_neighbors: Number of living neighbors (0-8)
             
         Returns:
-            The next state of the cell
+            The next state of the cell (dead for counts outside 0-8)
         """
-        if current_cell.is_alive():
-            return GameRules._apply_survival_rules(living_neighbors)
-        else:
-            return GameRules._apply_birth_rules(living_neighbors)
+        if not 0 <= living_neighbors <= 8:
+            return Cell.dead_cell()
+        return GameRules._NEXT_STATES[current_cell.is_alive()][living_neighbors]
+    
+    @staticmethod
+    def calculate_next_bits(alive: int, neighbor_counts: Tuple[int, int, int]) -> int:
+        """Calculate the next state of many bit-packed cells at once.
+        
+        A cell is alive next generation when it has 2 or 3 living
+        neighbors and either has exactly 3 or is already alive.
+        
+        Args:
+            alive: Bit-packed cell states, bit set for a living cell
+            neighbor_counts: Bit-sliced neighbor counts (ones, twos,
+                four_or_more) matching the bits of alive
+                
+        Returns:
+            Bit-packed next cell states
+        """
+        ones, twos, four_or_more = neighbor_counts
+        return twos & ~four_or_more & (ones | alive)
     
     @staticmethod
     def _apply_survival_rules(living_neighbors: int) -> Cell:
@@ -41,3 +64,9 @@ class GameRules:
         if living_neighbors == 3:
             return Cell.alive_cell()
         return Cell.dead_cell()
+
+
+GameRules._NEXT_STATES = (
+    tuple(GameRules._apply_birth_rules(count) for count in range(9)),
+    tuple(GameRules._apply_survival_rules(count) for count in range(9)),
+)
@@ -9,24 +9,28 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from game_of_life import GameOfLife
 
 
+@pytest.fixture(scope="session")
+def shared_game():
+    """Create one game for the whole session; fixtures reset it per test."""
+    return GameOfLife(random_density=0.0)
+
+
 @pytest.fixture
-def empty_game():
+def empty_game(shared_game):
     """Create a game with all dead cells."""
-    game = GameOfLife(random_density=0.0)
-    return game
+    shared_game.reset(random_density=0.0)
+    return shared_game
 
 
 @pytest.fixture
-def full_game():
+def full_game(shared_game):
     """Create a game with all alive cells."""
-    game = GameOfLife(random_density=1.0)
-    return game
+    shared_game.reset(random_density=1.0)
+    return shared_game
 
 
 @pytest.fixture
-def known_seed_game():
+def known_seed_game(shared_game):
     """Create a game with a known random seed for reproducibility."""
-    import random
-    random.seed(42)
-    game = GameOfLife(random_density=0.3)
-    return game
+    shared_game.reset(random_density=0.3, seed=42)
+    return shared_game
@@ -6,6 +6,7 @@ to ensure refactoring doesn't break existing functionality.
 """
 import pytest
 import random
+from config.game_config import GameConfig
 from game_of_life import GameOfLife
 
 
@@ -23,7 +24,7 @@ class TestGridInitialization:
         random.seed(42)
         game = GameOfLife(random_density=0.3)
         
-        alive_count = sum(sum(row) for row in game.grid)
+        alive_count = game.alive_count
         total_cells = 30 * 30
         actual_density = alive_count / total_cells
         
@@ -37,6 +38,13 @@ class TestGridInitialization:
             for cell in row:
                 assert isinstance(cell, bool)
     
+    def test_alive_count_matches_grid(self):
+        """alive_count should equal the number of True cells in the grid."""
+        game = GameOfLife(random_density=0.3)
+        game.step()
+        
+        assert game.alive_count == sum(sum(row) for row in game.grid)
+    
     def test_generation_starts_at_zero(self):
         """Generation counter should start at 0."""
         game = GameOfLife()
@@ -53,14 +61,35 @@ class TestGridInitialization:
         game = GameOfLife(random_density=1.0)
         alive_count = sum(sum(row) for row in game.grid)
         assert alive_count == 30 * 30
+    
+    def test_uniform_density_draws_no_random_numbers(self):
+        """Densities 0 and 1 should not consume the game's random sequence."""
+        game1 = GameOfLife(random_density=0.0, seed=42)
+        game1.reset(random_density=1.0)
+        game1.reset(random_density=0.3)
+        game2 = GameOfLife(random_density=0.3, seed=42)
+        
+        assert game1.grid == game2.grid
+    
+    def test_densities_finer_than_a_byte_keep_their_expected_count(self):
+        """Very low and very high densities should still be honoured on large grids."""
+        cells = 1024 * 1024
+        sparse = GameOfLife(random_density=0.001, seed=42,
+                            config=GameConfig(grid_size=1024, initial_density=0.001))
+        dense = GameOfLife(random_density=0.999, seed=42,
+                           config=GameConfig(grid_size=1024, initial_density=0.999))
+        
+        # Expected about 1049 alive / 1049 dead cells (standard deviation ~32)
+        assert 0.8 * 0.001 * cells <= sparse.alive_count <= 1.2 * 0.001 * cells
+        assert 0.8 * 0.001 * cells <= cells - dense.alive_count <= 1.2 * 0.001 * cells
 
 
 class TestNeighborCounting:
     """Test neighbor counting logic."""
     
-    def test_corner_cell_top_left(self):
+    def test_corner_cell_top_left(self, empty_game):
         """Top-left corner cell (0,0) has maximum 3 neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Set up: make all potential neighbors alive
         game.grid[0][1] = True  # right
         game.grid[1][0] = True  # below
@@ -69,9 +98,9 @@ class TestNeighborCounting:
         count = game._count_neighbors(0, 0)
         assert count == 3
     
-    def test_corner_cell_top_right(self):
+    def test_corner_cell_top_right(self, empty_game):
         """Top-right corner cell has maximum 3 neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         game.grid[0][28] = True  # left
         game.grid[1][28] = True  # below-left
         game.grid[1][29] = True  # below
@@ -79,9 +108,9 @@ class TestNeighborCounting:
         count = game._count_neighbors(0, 29)
         assert count == 3
     
-    def test_corner_cell_bottom_left(self):
+    def test_corner_cell_bottom_left(self, empty_game):
         """Bottom-left corner cell has maximum 3 neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         game.grid[28][0] = True  # above
         game.grid[28][1] = True  # above-right
         game.grid[29][1] = True  # right
@@ -89,9 +118,9 @@ class TestNeighborCounting:
         count = game._count_neighbors(29, 0)
         assert count == 3
     
-    def test_corner_cell_bottom_right(self):
+    def test_corner_cell_bottom_right(self, empty_game):
         """Bottom-right corner cell has maximum 3 neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         game.grid[28][28] = True  # above-left
         game.grid[28][29] = True  # above
         game.grid[29][28] = True  # left
@@ -99,9 +128,9 @@ class TestNeighborCounting:
         count = game._count_neighbors(29, 29)
         assert count == 3
     
-    def test_edge_cell_top(self):
+    def test_edge_cell_top(self, empty_game):
         """Top edge cell has maximum 5 neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Cell at (0, 15) - top edge, middle
         game.grid[0][14] = True  # left
         game.grid[0][16] = True  # right
@@ -112,9 +141,9 @@ class TestNeighborCounting:
         count = game._count_neighbors(0, 15)
         assert count == 5
     
-    def test_edge_cell_left(self):
+    def test_edge_cell_left(self, empty_game):
         """Left edge cell has maximum 5 neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Cell at (15, 0) - left edge, middle
         game.grid[14][0] = True  # above
         game.grid[14][1] = True  # above-right
@@ -125,9 +154,9 @@ class TestNeighborCounting:
         count = game._count_neighbors(15, 0)
         assert count == 5
     
-    def test_center_cell_has_eight_neighbors(self):
+    def test_center_cell_has_eight_neighbors(self, empty_game):
         """Center cell has maximum 8 neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Cell at (15, 15) - center
         positions = [
             (14, 14), (14, 15), (14, 16),
@@ -140,22 +169,22 @@ class TestNeighborCounting:
         count = game._count_neighbors(15, 15)
         assert count == 8
     
-    def test_count_all_alive_neighbors(self):
+    def test_count_all_alive_neighbors(self, full_game):
         """Correctly count when all neighbors are alive."""
-        game = GameOfLife(random_density=1.0)
+        game = full_game
         # In a full grid, every center cell has 8 alive neighbors
         count = game._count_neighbors(15, 15)
         assert count == 8
     
-    def test_count_all_dead_neighbors(self):
+    def test_count_all_dead_neighbors(self, empty_game):
         """Correctly count when all neighbors are dead."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         count = game._count_neighbors(15, 15)
         assert count == 0
     
-    def test_count_mixed_neighbors(self):
+    def test_count_mixed_neighbors(self, empty_game):
         """Correctly count mixed alive/dead neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Cell at (15, 15) - set 3 neighbors alive
         game.grid[14][15] = True  # above
         game.grid[15][16] = True  # right
@@ -164,9 +193,9 @@ class TestNeighborCounting:
         count = game._count_neighbors(15, 15)
         assert count == 3
     
-    def test_does_not_count_self(self):
+    def test_does_not_count_self(self, empty_game):
         """Should not count the cell itself as a neighbor."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         game.grid[15][15] = True  # Make center cell alive
         
         count = game._count_neighbors(15, 15)
@@ -176,18 +205,18 @@ class TestNeighborCounting:
 class TestGenerationCalculation:
     """Test Conway's Game of Life rules."""
     
-    def test_live_cell_dies_with_zero_neighbors(self):
+    def test_live_cell_dies_with_zero_neighbors(self, empty_game):
         """Live cell with 0 neighbors dies (under-population)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         game.grid[15][15] = True
         
         game.step()
         
         assert game.grid[15][15] == False
     
-    def test_live_cell_dies_with_one_neighbor(self):
+    def test_live_cell_dies_with_one_neighbor(self, empty_game):
         """Live cell with 1 neighbor dies (under-population)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         game.grid[15][15] = True
         game.grid[15][16] = True
         
@@ -195,9 +224,9 @@ class TestGenerationCalculation:
         
         assert game.grid[15][15] == False
     
-    def test_live_cell_survives_with_two_neighbors(self):
+    def test_live_cell_survives_with_two_neighbors(self, empty_game):
         """Live cell with 2 neighbors survives."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Create a stable pattern: 3 cells in a row (blinker)
         game.grid[15][14] = True
         game.grid[15][15] = True
@@ -209,9 +238,9 @@ class TestGenerationCalculation:
         # (Note: it rotates to vertical, so check column 15)
         assert game.grid[15][15] == True
     
-    def test_live_cell_survives_with_three_neighbors(self):
+    def test_live_cell_survives_with_three_neighbors(self, empty_game):
         """Live cell with 3 neighbors survives."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Create 2x2 block (stable pattern)
         game.grid[15][15] = True
         game.grid[15][16] = True
@@ -223,9 +252,9 @@ class TestGenerationCalculation:
         # Each cell has 3 neighbors (in a 2x2 block)
         assert game.grid[15][15] == True
     
-    def test_live_cell_dies_with_four_neighbors(self):
+    def test_live_cell_dies_with_four_neighbors(self, empty_game):
         """Live cell with 4 neighbors dies (over-population)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Create a + pattern
         game.grid[14][15] = True  # above
         game.grid[15][14] = True  # left
@@ -238,9 +267,9 @@ class TestGenerationCalculation:
         # Center cell had 4 neighbors, should die
         assert game.grid[15][15] == False
     
-    def test_live_cell_dies_with_more_than_three_neighbors(self):
+    def test_live_cell_dies_with_more_than_three_neighbors(self, full_game):
         """Live cell with >3 neighbors dies (over-population)."""
-        game = GameOfLife(random_density=1.0)
+        game = full_game
         # In a full grid, cells have 8 neighbors (except edges)
         
         game.step()
@@ -248,9 +277,9 @@ class TestGenerationCalculation:
         # All interior cells should die from overcrowding
         assert game.grid[15][15] == False
     
-    def test_dead_cell_becomes_alive_with_three_neighbors(self):
+    def test_dead_cell_becomes_alive_with_three_neighbors(self, empty_game):
         """Dead cell with exactly 3 neighbors becomes alive (reproduction)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Create L-shape, leaving one cell dead that has 3 neighbors
         game.grid[14][15] = True
         game.grid[15][15] = True
@@ -261,9 +290,9 @@ class TestGenerationCalculation:
         
         assert game.grid[14][16] == True
     
-    def test_dead_cell_stays_dead_with_two_neighbors(self):
+    def test_dead_cell_stays_dead_with_two_neighbors(self, empty_game):
         """Dead cell with 2 neighbors stays dead."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         game.grid[15][15] = True
         game.grid[15][16] = True
         # Cell at (15, 17) has 1 neighbor (only 15,16)
@@ -274,9 +303,9 @@ class TestGenerationCalculation:
         # These cells should stay dead
         assert game.grid[14][15] == False or game.grid[14][16] == False
     
-    def test_dead_cell_stays_dead_with_four_neighbors(self):
+    def test_dead_cell_stays_dead_with_four_neighbors(self, empty_game):
         """Dead cell with 4 neighbors stays dead."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         # Create + pattern with dead center
         game.grid[14][15] = True
         game.grid[15][14] = True
@@ -291,6 +320,21 @@ class TestGenerationCalculation:
         # (needs exactly 3)
 
 
+    def test_growing_pattern_keeps_few_cached_edge_masks(self):
+        """Stepping a growing pattern should not cache masks per band height."""
+        from domain.bitboard import _edge_masks
+        _edge_masks.cache_clear()
+        game = GameOfLife(random_density=0.0, config=GameConfig(grid_size=128))
+        # R-pentomino: its live band grows through most row counts
+        for row, col in [(63, 64), (63, 65), (64, 63), (64, 64), (65, 64)]:
+            game.grid[row][col] = True
+        
+        for _ in range(300):
+            game.step()
+        
+        assert _edge_masks.cache_info().currsize <= (128).bit_length()
+
+
 class TestGameFlow:
     """Test game flow and state management."""
     
@@ -335,15 +379,13 @@ class TestGameFlow:
     def test_grid_state_deterministic_for_same_seed(self):
         """Same seed should produce identical sequences."""
         # Game 1
-        random.seed(42)
-        game1 = GameOfLife(random_density=0.3)
+        game1 = GameOfLife(random_density=0.3, seed=42)
         game1.step()
         game1.step()
         state1 = [row[:] for row in game1.grid]
         
         # Game 2 with same seed
-        random.seed(42)
-        game2 = GameOfLife(random_density=0.3)
+        game2 = GameOfLife(random_density=0.3, seed=42)
         game2.step()
         game2.step()
         state2 = [row[:] for row in game2.grid]
@@ -351,13 +393,42 @@ class TestGameFlow:
         # Should be identical
         assert state1 == state2
     
-    def test_empty_grid_stays_empty(self):
+    def test_reset_restarts_from_generation_zero(self):
+        """Reset should refill the grid and restart the generation count."""
+        game = GameOfLife(random_density=0.3)
+        game.step()
+        
+        game.reset(random_density=1.0)
+        
+        assert game.generation == 0
+        assert game.alive_count == 30 * 30
+    
+    def test_grid_can_be_assigned_from_nested_lists(self, empty_game):
+        """Assigning a 2D boolean list should replace the grid state."""
+        source = GameOfLife(random_density=0.3)
+        state = [row[:] for row in source.grid]
+        game = empty_game
+        
+        game.grid = state
+        
+        assert game.grid == state
+    
+    def test_grids_compare_by_cell_state(self):
+        """Grids of two games should be equal exactly when cells match."""
+        game1 = GameOfLife(random_density=0.3, seed=42)
+        game2 = GameOfLife(random_density=0.3, seed=42)
+        
+        assert game1.grid == game2.grid
+        game1.grid[0][0] = not game1.grid[0][0]
+        assert game1.grid != game2.grid
+    
+    def test_empty_grid_stays_empty(self, empty_game):
         """Empty grid should remain empty (no spontaneous generation)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         game.step()
         
-        alive_count = sum(sum(row) for row in game.grid)
+        alive_count = game.alive_count
         assert alive_count == 0
     
     def test_step_preserves_grid_size(self):
@@ -368,3 +439,48 @@ class TestGameFlow:
         
         assert len(game.grid) == 30
         assert all(len(row) == 30 for row in game.grid)
+
+
+class TestWrappedBoundary:
+    """Test neighbor counting and stepping with boundary='wrap'."""
+    
+    def test_corner_cell_has_eight_neighbors_when_wrapping(self):
+        """On a torus, a corner cell of a full grid has 8 living neighbors."""
+        config = GameConfig(initial_density=1.0, boundary='wrap')
+        game = GameOfLife(random_density=1.0, config=config)
+        
+        assert game._count_neighbors(0, 0) == 8
+        assert game._count_neighbors(29, 29) == 8
+    
+    def test_edge_cells_count_neighbors_across_the_edge(self):
+        """Neighbors on the opposite edge should be counted when wrapping."""
+        config = GameConfig(initial_density=0.0, boundary='wrap')
+        game = GameOfLife(random_density=0.0, config=config)
+        game.grid[29][29] = True  # diagonal across both edges
+        game.grid[0][29] = True   # left across the vertical edge
+        game.grid[29][0] = True   # above across the horizontal edge
+        
+        assert game._count_neighbors(0, 0) == 3
+    
+    def test_blinker_across_the_edge_oscillates(self):
+        """A blinker straddling the left/right edge should keep oscillating."""
+        config = GameConfig(initial_density=0.0, boundary='wrap')
+        game = GameOfLife(random_density=0.0, config=config)
+        game.grid[15][29] = True
+        game.grid[15][0] = True
+        game.grid[15][1] = True
+        
+        game.step()
+        
+        assert game.grid[14][0] == True
+        assert game.grid[15][0] == True
+        assert game.grid[16][0] == True
+        assert game.grid[15][29] == False
+        assert game.grid[15][1] == False
+        assert game.alive_count == 3
+        
+        game.step()
+        
+        assert game.grid[15][29] == True
+        assert game.grid[15][1] == True
+        assert game.alive_count == 3
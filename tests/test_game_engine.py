@@ -100,3 +100,174 @@ class TestGameEngine:
             engine.step()
         
         assert engine.generation.number == 5
+    
+    def test_edges_do_not_wrap_around(self):
+        """Cells on opposite edges should not count as neighbors."""
+        size = GridSize(10, 10)
+        grid = Grid(size)
+        config = GameConfig(grid_size=10)
+        
+        # Vertical blinker hugging the left edge
+        grid.set_cell(Position(4, 0), Cell.alive_cell())
+        grid.set_cell(Position(5, 0), Cell.alive_cell())
+        grid.set_cell(Position(6, 0), Cell.alive_cell())
+        
+        engine = GameEngine(grid, config)
+        engine.step()
+        
+        # Only the in-bounds half of the horizontal phase is born
+        assert engine.grid.get_cell(Position(5, 0)).is_alive()
+        assert engine.grid.get_cell(Position(5, 1)).is_alive()
+        assert engine.grid.get_cell(Position(5, 9)).is_dead()
+        assert engine.grid.get_cell(Position(4, 0)).is_dead()
+        assert engine.grid.get_cell(Position(6, 0)).is_dead()
+    
+    def test_edges_wrap_around_when_configured(self):
+        """With boundary='wrap', opposite edges should be neighbors."""
+        size = GridSize(10, 10)
+        grid = Grid(size)
+        config = GameConfig(grid_size=10, boundary='wrap')
+        
+        # Horizontal blinker straddling the top-left corner
+        grid.set_cell(Position(0, 9), Cell.alive_cell())
+        grid.set_cell(Position(0, 0), Cell.alive_cell())
+        grid.set_cell(Position(0, 1), Cell.alive_cell())
+        
+        engine = GameEngine(grid, config)
+        engine.step()
+        
+        assert engine.grid.living_cells() == {Position(9, 0), Position(0, 0), Position(1, 0)}
+    
+    def test_invalid_boundary_is_rejected(self):
+        """GameConfig should reject unknown boundary modes."""
+        with pytest.raises(ValueError):
+            GameConfig(boundary='reflect')
+    
+    def test_steps_update_the_grid_in_place(self):
+        """Steps should overwrite the engine's grid instead of allocating."""
+        size = GridSize(10, 10)
+        grid = Grid(size)
+        config = GameConfig(grid_size=10)
+        engine = GameEngine(grid, config)
+        
+        engine.step()
+        engine.step()
+        
+        assert engine.grid is grid
+    
+    def test_living_cells_follow_in_place_steps(self):
+        """Living cells should reflect the current generation after a step."""
+        size = GridSize(10, 10)
+        grid = Grid(size)
+        grid.set_cell(Position(5, 3), Cell.alive_cell())
+        grid.set_cell(Position(5, 4), Cell.alive_cell())
+        config = GameConfig(grid_size=10)
+        engine = GameEngine(grid, config)
+        
+        assert engine.grid.living_cells() == {Position(5, 3), Position(5, 4)}
+        engine.step()
+        assert engine.grid.living_cells() == set()
+    
+    def test_cells_set_between_steps_are_stepped(self):
+        """Cells written after a step should take part in the next one."""
+        size = GridSize(10, 10)
+        config = GameConfig(grid_size=10)
+        engine = GameEngine(Grid(size), config)
+        engine.step()
+        for col in range(3, 6):
+            engine.grid.set_cell(Position(5, col), Cell.alive_cell())
+        
+        engine.step()
+        
+        assert engine.grid.living_cells() == {Position(4, 4), Position(5, 4), Position(6, 4)}
+    
+    def test_run_advances_render_every_generations_per_frame(self):
+        """Run should step render_every generations between frames."""
+        size = GridSize(10, 10)
+        config = GameConfig(grid_size=10, delay=0, render_every=3)
+        engine = GameEngine(Grid(size), config)
+        engine.display = _FramesThenStop(frames=2)
+        
+        engine.run()
+        
+        assert engine.display.rendered == [0, 3]
+    
+    def test_run_skips_a_render_when_behind_schedule(self, monkeypatch):
+        """Run should skip rendering, but not stepping, when frames run late."""
+        clock = _SlowClock(seconds_per_call=1.0)
+        monkeypatch.setattr('engine.game_engine.time', clock)
+        size = GridSize(10, 10)
+        config = GameConfig(grid_size=10, delay=0.5)
+        engine = GameEngine(Grid(size), config)
+        engine.display = _FramesThenStop(frames=3)
+        
+        engine.run()
+        
+        assert engine.display.rendered == [0, 2, 4]
+        assert clock.slept == []
+    
+    def test_run_restarts_its_schedule_after_a_stall(self, monkeypatch):
+        """A long stall should not be followed by an unpaced catch-up burst."""
+        clock = _ScriptedClock(readings=[0.0, 0.1, 10.0, 10.0, 10.1])
+        monkeypatch.setattr('engine.game_engine.time', clock)
+        size = GridSize(10, 10)
+        config = GameConfig(grid_size=10, delay=0.5)
+        engine = GameEngine(Grid(size), config)
+        engine.display = _FramesThenStop(frames=4)
+        
+        engine.run()
+        
+        assert engine.display.rendered == [0, 1, 2, 3]
+        assert clock.slept == [pytest.approx(0.4), pytest.approx(0.4)]
+    
+    def test_zero_width_grid_has_one_empty_row_per_row(self):
+        """A grid without columns should still report each of its rows."""
+        grid = Grid(GridSize(0, 3))
+        
+        assert grid.rows() == [b'', b'', b'']
+
+
+class _ScriptedClock:
+    """Stand-in for the time module that returns preset clock readings."""
+    
+    def __init__(self, readings):
+        self.readings = list(readings)
+        self.slept = []
+    
+    def monotonic(self):
+        return self.readings.pop(0)
+    
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+
+
+class _SlowClock:
+    """Stand-in for the time module whose clock advances on every read."""
+    
+    def __init__(self, seconds_per_call: float):
+        self.seconds_per_call = seconds_per_call
+        self.now = 0.0
+        self.slept = []
+    
+    def monotonic(self):
+        self.now += self.seconds_per_call
+        return self.now
+    
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+
+
+class _FramesThenStop:
+    """Display stand-in that records frames and stops the game loop."""
+    
+    def __init__(self, frames: int):
+        self.frames = frames
+        self.rendered = []
+    
+    def render(self, grid, generation):
+        self.rendered.append(generation.number)
+        if len(self.rendered) == self.frames:
+            raise KeyboardInterrupt
+    
+    def show_exit_message(self, generation):
+        pass
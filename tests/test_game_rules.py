@@ -41,6 +41,12 @@ class TestGameRules:
         next_state = GameRules.calculate_next_state(dead_cell, neighbors)
         assert next_state.is_alive() == expected_alive
     
+    @pytest.mark.parametrize("neighbors", [-6, -1, 9, 12])
+    @pytest.mark.parametrize("cell", [Cell.alive_cell(), Cell.dead_cell()])
+    def test_out_of_range_counts_give_dead_cell(self, cell, neighbors):
+        """Counts outside 0-8 should yield a dead cell, never wrap around."""
+        assert GameRules.calculate_next_state(cell, neighbors).is_dead()
+    
     def test_survival_with_two_neighbors(self):
         """Live cell with 2 neighbors survives."""
         cell = Cell.alive_cell()
@@ -77,3 +83,15 @@ class TestGameRules:
         for neighbors in [0, 1, 2, 4, 5, 6, 7, 8]:
             result = GameRules.calculate_next_state(cell, neighbors)
             assert result.is_dead(), f"Failed with {neighbors} neighbors"
+    
+    @pytest.mark.parametrize("neighbors", range(9))
+    @pytest.mark.parametrize("cell", [Cell.alive_cell(), Cell.dead_cell()])
+    def test_bitwise_rules_match_cell_rules(self, cell, neighbors):
+        """Bit-packed rules should agree with calculate_next_state."""
+        alive = 1 if cell.is_alive() else 0
+        counts = (neighbors & 1, (neighbors >> 1) & 1, int(neighbors >= 4))
+        
+        next_bits = GameRules.calculate_next_bits(alive, counts)
+        
+        expected = GameRules.calculate_next_state(cell, neighbors)
+        assert bool(next_bits) == expected.is_alive()
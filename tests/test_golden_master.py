@@ -11,9 +11,9 @@ from game_of_life import GameOfLife
 class TestBlinkerPattern:
     """Test the blinker oscillator (period-2)."""
     
-    def test_blinker_oscillates_correctly(self):
+    def test_blinker_oscillates_correctly(self, empty_game):
         """Blinker should alternate between horizontal and vertical."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         # Initial state: horizontal line
         game.grid[15][14] = True
@@ -21,7 +21,7 @@ class TestBlinkerPattern:
         game.grid[15][16] = True
         
         # Capture initial state
-        initial_state = [row[:] for row in game.grid]
+        initial_state = game.snapshot()
         
         # Step 1: Should become vertical
         game.step()
@@ -40,32 +40,32 @@ class TestBlinkerPattern:
         assert game.grid[16][15] == False
         
         # Verify it returned to initial state
-        assert game.grid == initial_state
+        assert game.equals_snapshot(initial_state)
     
-    def test_blinker_period_is_two(self):
+    def test_blinker_period_is_two(self, empty_game):
         """Blinker should have period 2 (returns to initial state after 2 steps)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         # Set up blinker
         game.grid[10][10] = True
         game.grid[10][11] = True
         game.grid[10][12] = True
         
-        initial = [row[:] for row in game.grid]
+        initial = game.snapshot()
         
         # After 2 steps, should be identical
         game.step()
         game.step()
         
-        assert game.grid == initial
+        assert game.equals_snapshot(initial)
 
 
 class TestBlockPattern:
     """Test the block still life (period-1)."""
     
-    def test_block_remains_stable(self):
+    def test_block_remains_stable(self, empty_game):
         """2x2 block should never change."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         # Create 2x2 block
         game.grid[15][15] = True
@@ -73,18 +73,18 @@ class TestBlockPattern:
         game.grid[16][15] = True
         game.grid[16][16] = True
         
-        initial_state = [row[:] for row in game.grid]
+        initial_state = game.snapshot()
         
         # Run for 10 generations
         for _ in range(10):
             game.step()
         
         # Should be unchanged
-        assert game.grid == initial_state
+        assert game.equals_snapshot(initial_state)
     
-    def test_block_each_cell_has_three_neighbors(self):
+    def test_block_each_cell_has_three_neighbors(self, empty_game):
         """Each cell in 2x2 block has exactly 3 neighbors."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         game.grid[15][15] = True
         game.grid[15][16] = True
@@ -101,9 +101,9 @@ class TestBlockPattern:
 class TestBeehivePattern:
     """Test the beehive still life."""
     
-    def test_beehive_remains_stable(self):
+    def test_beehive_remains_stable(self, empty_game):
         """Beehive pattern should never change."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         # Create beehive pattern
         #  .██.
@@ -116,22 +116,22 @@ class TestBeehivePattern:
         game.grid[16][15] = True
         game.grid[16][16] = True
         
-        initial_state = [row[:] for row in game.grid]
+        initial_state = game.snapshot()
         
         # Run for 10 generations
         for _ in range(10):
             game.step()
         
         # Should be unchanged
-        assert game.grid == initial_state
+        assert game.equals_snapshot(initial_state)
 
 
 class TestGliderPattern:
     """Test the glider spaceship."""
     
-    def test_glider_moves_diagonally(self):
+    def test_glider_moves_diagonally(self, empty_game):
         """Glider should move down and to the right."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         # Initial glider at top-left area
         # .█.
@@ -145,22 +145,22 @@ class TestGliderPattern:
         game.grid[start_row + 2][start_col + 2] = True
         
         # Save initial state
-        initial_state = [row[:] for row in game.grid]
+        initial_state = game.snapshot()
         
         # Run for 4 generations (one complete cycle)
         for _ in range(4):
             game.step()
         
         # Should still have 5 alive cells
-        final_alive = sum(sum(row) for row in game.grid)
+        final_alive = game.alive_count
         assert final_alive == 5
         
         # Glider should have moved (state should be different)
-        assert game.grid != initial_state
+        assert not game.equals_snapshot(initial_state)
     
-    def test_glider_has_period_four(self):
+    def test_glider_has_period_four(self, empty_game):
         """Glider returns to same shape after 4 generations (but translated)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         # Set up glider
         game.grid[5][6] = True
@@ -174,16 +174,16 @@ class TestGliderPattern:
             game.step()
         
         # Should still have exactly 5 alive cells
-        alive = sum(sum(row) for row in game.grid)
+        alive = game.alive_count
         assert alive == 5
 
 
 class TestToadPattern:
     """Test the toad oscillator (period-2)."""
     
-    def test_toad_oscillates(self):
+    def test_toad_oscillates(self, empty_game):
         """Toad should oscillate between two states."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         # Initial toad pattern
         # .███
@@ -195,19 +195,19 @@ class TestToadPattern:
         game.grid[16][15] = True
         game.grid[16][16] = True
         
-        initial = [row[:] for row in game.grid]
+        initial = game.snapshot()
         
         # Should have 6 cells
-        assert sum(sum(row) for row in game.grid) == 6
+        assert game.alive_count == 6
         
         # After 1 step, pattern changes
         game.step()
-        assert game.grid != initial
-        assert sum(sum(row) for row in game.grid) == 6  # Still 6 cells
+        assert not game.equals_snapshot(initial)
+        assert game.alive_count == 6  # Still 6 cells
         
         # After 2 steps, back to original
         game.step()
-        assert game.grid == initial
+        assert game.equals_snapshot(initial)
 
 
 class TestReproducibility:
@@ -215,19 +215,15 @@ class TestReproducibility:
     
     def test_same_seed_produces_same_sequence(self):
         """Two games with same seed should be identical."""
-        import random
-        
         # Game 1
-        random.seed(12345)
-        game1 = GameOfLife(random_density=0.3)
+        game1 = GameOfLife(random_density=0.3, seed=12345)
         for _ in range(10):
             game1.step()
         state1 = [row[:] for row in game1.grid]
         gen1 = game1.generation
         
         # Game 2 with same seed
-        random.seed(12345)
-        game2 = GameOfLife(random_density=0.3)
+        game2 = GameOfLife(random_density=0.3, seed=12345)
         for _ in range(10):
             game2.step()
         state2 = [row[:] for row in game2.grid]
@@ -239,16 +235,12 @@ class TestReproducibility:
     
     def test_different_seeds_produce_different_sequences(self):
         """Different seeds should produce different results."""
-        import random
-        
         # Game 1
-        random.seed(111)
-        game1 = GameOfLife(random_density=0.3)
+        game1 = GameOfLife(random_density=0.3, seed=111)
         state1 = [row[:] for row in game1.grid]
         
         # Game 2 with different seed
-        random.seed(999)
-        game2 = GameOfLife(random_density=0.3)
+        game2 = GameOfLife(random_density=0.3, seed=999)
         state2 = [row[:] for row in game2.grid]
         
         # Should be different (with extremely high probability)
@@ -258,41 +250,41 @@ class TestReproducibility:
 class TestComplexPatterns:
     """Test more complex patterns."""
     
-    def test_empty_grid_stays_empty(self):
+    def test_empty_grid_stays_empty(self, empty_game):
         """Empty grid should produce no life."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         for _ in range(100):
             game.step()
         
-        alive = sum(sum(row) for row in game.grid)
+        alive = game.alive_count
         assert alive == 0
     
-    def test_full_grid_dies_quickly(self):
+    def test_full_grid_dies_quickly(self, full_game):
         """Full grid should mostly die from overcrowding."""
-        game = GameOfLife(random_density=1.0)
+        game = full_game
         
-        initial_alive = sum(sum(row) for row in game.grid)
+        initial_alive = game.alive_count
         
         game.step()
         
-        final_alive = sum(sum(row) for row in game.grid)
+        final_alive = game.alive_count
         
         # Should have significantly fewer alive cells
         assert final_alive < initial_alive * 0.5
     
-    def test_single_cell_dies(self):
+    def test_single_cell_dies(self, empty_game):
         """Single cell should die (under-population)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         game.grid[15][15] = True
         
         game.step()
         
         assert game.grid[15][15] == False
     
-    def test_r_pentomino_is_methuselah(self):
+    def test_r_pentomino_is_methuselah(self, empty_game):
         """R-pentomino should have long lifetime (>100 generations)."""
-        game = GameOfLife(random_density=0.0)
+        game = empty_game
         
         # R-pentomino pattern
         # .██
@@ -308,5 +300,5 @@ class TestComplexPatterns:
         for _ in range(100):
             game.step()
         
-        alive = sum(sum(row) for row in game.grid)
+        alive = game.alive_count
         assert alive > 0  # Still has life